@@ -0,0 +1,40 @@
+"""
+Shared .env loading for the Junk Mover scripts.
+
+Each script imports `load_env_from_root` from here so the repo-level .env is parsed by one
+implementation, and at most once per process.
+"""
+
+import functools
+import os
+import re
+from pathlib import Path
+from typing import Dict
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# One KEY=value assignment per line, with whitespace around the key and value trimmed by the
+# pattern itself; comments and blank lines simply never match.
+_ENV_ASSIGNMENT = re.compile(rb"^[ \t]*([A-Za-z_]\w*)[ \t]*=[ \t]*(.*?)[ \t\r]*$", re.M)
+
+
+@functools.lru_cache(maxsize=1)
+def _read_env_file() -> Dict[str, str]:
+    """Parse the project-root .env into a dict, returning an empty one if it is missing."""
+    try:
+        raw = (ROOT / ".env").read_bytes()
+    except FileNotFoundError:
+        return {}
+
+    values: Dict[str, str] = {}
+    for key, value in _ENV_ASSIGNMENT.findall(raw):
+        # The first assignment of a key wins, as it would with os.environ.setdefault.
+        values.setdefault(key.decode(), value.decode())
+    return values
+
+
+def load_env_from_root() -> None:
+    """Load .env values from the project root into os.environ if present."""
+    # Keep secrets/config centralized in the repo-level .env for portability.
+    for key, value in _read_env_file().items():
+        os.environ.setdefault(key, value)
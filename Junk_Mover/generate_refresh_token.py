@@ -20,21 +20,7 @@ from typing import List
 import webbrowser
 from urllib import error, parse, request
 
-ROOT = Path(__file__).resolve().parents[1]
-
-
-def load_env_from_root() -> None:
-    # Centralize config by loading the repo-level .env so secrets stay out of code.
-    """Load .env values from the project root into os.environ if present."""
-    env_path = ROOT / ".env"
-    if not env_path.exists():
-        return
-
-    for line in env_path.read_text().splitlines():
-        if not line or line.lstrip().startswith("#") or "=" not in line:
-            continue
-        key, value = line.split("=", 1)
-        os.environ.setdefault(key.strip(), value.strip())
+from _env import ROOT, load_env_from_root
 
 
 def require_env(keys: List[str]) -> None:
@@ -88,20 +74,37 @@ def exchange_code_for_tokens(
 
 def update_env_refresh_token(env_path: Path, refresh_token: str) -> None:
     # Persist the refresh token back into .env to avoid manual edits.
-    if not env_path.exists():
-        env_path.write_text(f"JUNK_MOVER_REFRESH_TOKEN={refresh_token}\n", encoding="utf-8")
+    token_entry = f"JUNK_MOVER_REFRESH_TOKEN={refresh_token}"
+    # Open directly instead of checking exists() first, so the check and write can't race.
+    # newline="" keeps the file's own line endings (e.g. CRLF) intact on rewrite.
+    try:
+        handle = env_path.open("r+", encoding="utf-8", newline="")
+    except FileNotFoundError:
+        env_path.write_text(token_entry + "\n", encoding="utf-8")
         return
 
-    lines = env_path.read_text(encoding="utf-8").splitlines()
-    updated = False
-    for idx, line in enumerate(lines):
-        if line.startswith("JUNK_MOVER_REFRESH_TOKEN="):
-            lines[idx] = f"JUNK_MOVER_REFRESH_TOKEN={refresh_token}"
-            updated = True
-            break
-    if not updated:
-        lines.append(f"JUNK_MOVER_REFRESH_TOKEN={refresh_token}")
-    env_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    # Scan and write through one handle; only a replacement needs the whole file rewritten.
+    with handle:
+        lines = []
+        token_index = None
+        for idx, line in enumerate(handle):
+            if token_index is None and line.startswith("JUNK_MOVER_REFRESH_TOKEN="):
+                token_index = idx
+            lines.append(line)
+        line_ending = "\r\n" if lines and lines[0].endswith("\r\n") else "\n"
+
+        if token_index is None:
+            # First token for this .env: append the line instead of rewriting everything.
+            handle.seek(0, os.SEEK_END)
+            if lines and not lines[-1].endswith("\n"):
+                handle.write(line_ending)
+            handle.write(token_entry + line_ending)
+            return
+
+        lines[token_index] = token_entry + line_ending
+        handle.seek(0)
+        handle.writelines(lines)
+        handle.truncate()
 
 
 def main() -> None:
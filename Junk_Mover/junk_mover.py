@@ -11,32 +11,74 @@ Behavior:
 
 import base64
 import datetime as dt
+import functools
+import gzip
+import hashlib
+import http.client
+import itertools
 import json
 import logging
 import logging.handlers
 import os
+import random
+import select
+import ssl
 import sys
-from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple
-from urllib import error, parse, request
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from urllib import parse, request
 
-ROOT = Path(__file__).resolve().parents[1]
-LOG_DIR = ROOT / "logs"
-LOG_FILE = LOG_DIR / "junk_mover.log"
+try:
+    import orjson
+except ImportError:  # Optional speedup; the stdlib json module remains the baseline.
+    orjson = None
 
+from _env import ROOT, load_env_from_root
 
-def load_env_from_root() -> None:
-    """Load .env values from the project root into os.environ if present."""
-    # Keep secrets/config centralized in the repo-level .env for portability.
-    env_path = ROOT / ".env"
-    if not env_path.exists():
-        return
-
-    for line in env_path.read_text().splitlines():
-        if not line or line.lstrip().startswith("#") or "=" not in line:
-            continue
-        key, value = line.split("=", 1)
-        os.environ.setdefault(key.strip(), value.strip())
+LOG_DIR = ROOT / "logs"
+LOG_FILE = LOG_DIR / "junk_mover.log"
+LOG_BUFFER_RECORDS = 256
+TOKEN_CACHE_FILE = ROOT / ".cache" / "junk_mover_token.json"
+# Only reuse a cached token with enough life left to outlast a long, rate-limited run.
+TOKEN_MIN_REMAINING_SECONDS = 15 * 60
+HTTP_TIMEOUT_SECONDS = 30
+# Servers drop idle keep-alive sockets on their own schedule; don't bet on old ones.
+MAX_IDLE_SECONDS = 5
+MAX_CONNECTIONS_PER_HOST = 8
+PAGE_FETCH_WORKERS = MAX_CONNECTIONS_PER_HOST
+BUCKET_WORKERS = 6
+MAX_REQUEST_RETRIES = 5
+MAX_BACKOFF_SECONDS = 30
+# Longer Retry-After waits mean sustained throttling; give up rather than stall a scheduled run.
+MAX_RETRY_AFTER_SECONDS = 120
+# Transient gateway/server failures worth retrying, but only for requests that are safe to
+# repeat: a POST that failed with a 5xx may still have added tracks.
+RETRYABLE_SERVER_ERRORS = frozenset({500, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "PUT", "DELETE"})
+# Spotify accepts at most 100 tracks per add/remove call.
+TRACK_BATCH_SIZE = 100
+
+# Persistent HTTPS connections shared by every thread so repeated calls skip the TCP/TLS
+# handshake. A connection is checked out by one request at a time and returned afterwards,
+# and each host is capped at MAX_CONNECTIONS_PER_HOST open sockets.
+_POOL_LOCK = threading.Lock()
+# Idle connections per host, each with the monotonic time it was returned to the pool.
+_IDLE_CONNECTIONS: Dict[str, List[Tuple[http.client.HTTPSConnection, float]]] = {}
+_CONNECTION_SLOTS: Dict[str, threading.BoundedSemaphore] = {}
+
+
+if orjson is not None:
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+else:
+    _json_loads = json.loads
+
+    def _json_dumps(data: Any) -> bytes:
+        """Encode a request body as compact JSON bytes, matching orjson's output shape."""
+        return json.dumps(data, separators=(",", ":")).encode()
 
 
 def require_env(keys: List[str]) -> None:
@@ -60,12 +102,213 @@ def setup_logging() -> None:
         "%(asctime)s [%(levelname)s] %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
     )
     handler.setFormatter(formatter)
+    # Batch file writes so a run's per-batch INFO lines hit the SD card together; warnings
+    # and errors flush immediately, and logging's own exit hook flushes whatever is left.
+    buffered_handler = logging.handlers.MemoryHandler(
+        capacity=LOG_BUFFER_RECORDS, flushLevel=logging.WARNING, target=handler
+    )
 
-    logging.basicConfig(level=logging.INFO, handlers=[handler, logging.StreamHandler(sys.stdout)])
+    logging.basicConfig(
+        level=logging.INFO, handlers=[buffered_handler, logging.StreamHandler(sys.stdout)]
+    )
+
+
+def _connection_slots(host: str) -> threading.BoundedSemaphore:
+    """Return the semaphore limiting how many connections to a host may be open at once."""
+    with _POOL_LOCK:
+        slots = _CONNECTION_SLOTS.get(host)
+        if slots is None:
+            slots = _CONNECTION_SLOTS[host] = threading.BoundedSemaphore(MAX_CONNECTIONS_PER_HOST)
+        return slots
+
+
+class _RequestNotSentError(ConnectionError):
+    """The connection failed while sending, so Spotify never received the full request."""
+
+
+def _is_connection_dropped(conn: http.client.HTTPSConnection) -> bool:
+    """Return whether an idle connection has been closed by the server (or never opened)."""
+    # An idle keep-alive socket should have nothing to read; readable means EOF or junk.
+    if conn.sock is None:
+        return True
+    try:
+        return bool(select.select([conn.sock], [], [], 0)[0])
+    except (OSError, ValueError):
+        return True
+
+
+def _open_connection(host: str) -> http.client.HTTPSConnection:
+    """Open a new HTTPS connection to host, tunnelling through HTTPS_PROXY when configured."""
+    # Honor https_proxy/no_proxy the way urllib's default ProxyHandler does.
+    proxy = request.getproxies().get("https")
+    if not proxy or request.proxy_bypass(host):
+        return http.client.HTTPSConnection(host, timeout=HTTP_TIMEOUT_SECONDS)
+
+    if "//" not in proxy:
+        proxy = f"http://{proxy}"
+    proxy_parts = parse.urlsplit(proxy)
+    default_port = 443 if proxy_parts.scheme == "https" else 80
+    tunnel_headers = {}
+    if proxy_parts.username:
+        user = parse.unquote(proxy_parts.username)
+        password = parse.unquote(proxy_parts.password or "")
+        credentials = base64.b64encode(f"{user}:{password}".encode()).decode()
+        tunnel_headers["Proxy-Authorization"] = f"Basic {credentials}"
+    conn = http.client.HTTPSConnection(
+        proxy_parts.hostname, proxy_parts.port or default_port, timeout=HTTP_TIMEOUT_SECONDS
+    )
+    conn.set_tunnel(host, headers=tunnel_headers)
+    return conn
+
+
+def _checkout_connection(host: str, fresh: bool = False) -> http.client.HTTPSConnection:
+    """Take a live idle keep-alive connection for a host, or open one, waiting if at the limit."""
+    _connection_slots(host).acquire()
+    with _POOL_LOCK:
+        idle = _IDLE_CONNECTIONS.setdefault(host, [])
+        while idle:
+            # LIFO: the most recently used socket is the least likely to have been closed.
+            # A caller asking for a fresh socket just hit a stale one, so drop its idle peers.
+            conn, idle_since = idle.pop()
+            too_old = time.monotonic() - idle_since > MAX_IDLE_SECONDS
+            if fresh or too_old or _is_connection_dropped(conn):
+                conn.close()
+                continue
+            return conn
+    return _open_connection(host)
+
+
+def _return_connection(host: str, conn: http.client.HTTPSConnection, reusable: bool) -> None:
+    """Hand a connection back to the pool, or close it if it cannot carry another request."""
+    if reusable:
+        with _POOL_LOCK:
+            _IDLE_CONNECTIONS.setdefault(host, []).append((conn, time.monotonic()))
+    else:
+        conn.close()
+    _connection_slots(host).release()
+
+
+def _send(
+    host: str,
+    method: str,
+    path: str,
+    body: Optional[bytes],
+    headers: Dict[str, str],
+    fresh: bool = False,
+) -> Tuple[int, http.client.HTTPMessage, bytes]:
+    """Issue one request on a pooled connection, discarding the connection on any failure."""
+    conn = _checkout_connection(host, fresh=fresh)
+    reusable = False
+    try:
+        try:
+            conn.request(method, path, body=body, headers=headers)
+        except (ConnectionResetError, BrokenPipeError, ssl.SSLEOFError) as exc:
+            # The socket died before the request was fully written, so it was never processed.
+            raise _RequestNotSentError(str(exc)) from exc
+        resp = conn.getresponse()
+        raw_body = resp.read()
+        reusable = not resp.will_close
+    finally:
+        _return_connection(host, conn, reusable)
+    return resp.status, resp.headers, raw_body
+
+
+def http_request(
+    method: str, url: str, body: Optional[bytes] = None, headers: Optional[Dict[str, str]] = None
+) -> Tuple[int, http.client.HTTPMessage, bytes]:
+    """Send a request over a reused HTTPS connection and return (status, headers, body)."""
+    parts = parse.urlsplit(url)
+    path = parts.path + (f"?{parts.query}" if parts.query else "")
+    try:
+        status, resp_headers, raw_body = _send(parts.netloc, method, path, body, headers or {})
+    except (_RequestNotSentError, http.client.RemoteDisconnected, ConnectionResetError) as exc:
+        # Spotify may close a keep-alive socket between calls; retry once on a fresh one. A
+        # failure after the request went out may mean it was processed, so only repeat
+        # those when the method is safe to.
+        if not isinstance(exc, _RequestNotSentError) and method not in IDEMPOTENT_METHODS:
+            raise
+        status, resp_headers, raw_body = _send(
+            parts.netloc, method, path, body, headers or {}, fresh=True
+        )
+    # http.client leaves content codings alone, so undo the gzip we asked for ourselves.
+    if resp_headers.get("Content-Encoding", "").lower() == "gzip":
+        raw_body = gzip.decompress(raw_body)
+    return status, resp_headers, raw_body
+
+
+def _refresh_token_key(refresh_token: str) -> str:
+    """Hash the refresh token so the cache can be keyed by it without storing the secret."""
+    return hashlib.sha256(refresh_token.encode()).hexdigest()
+
+
+def load_cached_access_token(refresh_token: str) -> Optional[str]:
+    """Return the cached access token for this refresh token if it has plenty of life left."""
+    try:
+        cached = json.loads(TOKEN_CACHE_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    # A hand-edited or corrupt cache should only cost a token refresh, never the run.
+    if not isinstance(cached, dict):
+        return None
+    if cached.get("refresh_token_sha256") != _refresh_token_key(refresh_token):
+        return None
+    try:
+        if cached.get("expires_at", 0) - time.time() < TOKEN_MIN_REMAINING_SECONDS:
+            return None
+    except TypeError:
+        return None
+    access_token = cached.get("access_token")
+    return access_token if isinstance(access_token, str) and access_token else None
+
+
+def save_cached_access_token(refresh_token: str, access_token: str, expires_in: int) -> None:
+    """Atomically persist the access token and its expiry, readable only by the owner."""
+    # Write to a temp file and swap it in so a crash never leaves a half-written cache.
+    entry = {
+        "refresh_token_sha256": _refresh_token_key(refresh_token),
+        "access_token": access_token,
+        "expires_at": time.time() + expires_in,
+    }
+    tmp_path = TOKEN_CACHE_FILE.with_suffix(".tmp")
+    try:
+        TOKEN_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(entry, handle)
+        os.chmod(tmp_path, 0o600)
+        os.replace(tmp_path, TOKEN_CACHE_FILE)
+    except OSError as exc:
+        # A missing cache only costs a token refresh next run, so never fail the run over it.
+        logging.warning("Could not write token cache %s: %s", TOKEN_CACHE_FILE, exc)
+
+
+@functools.lru_cache(maxsize=None)
+def _basic_auth_header(client_id: str, client_secret: str) -> str:
+    """Return the HTTP Basic credentials header value for the Spotify app."""
+    credentials = base64.b64encode(f"{client_id}:{client_secret}".encode()).decode()
+    return f"Basic {credentials}"
+
+
+@functools.lru_cache(maxsize=None)
+def _api_headers(access_token: str) -> Dict[str, str]:
+    """Return the shared Web API request headers for a bearer token, built once per token."""
+    # Treat the returned dict as read-only; every spotify_request call reuses it.
+    return {
+        "Authorization": f"Bearer {access_token}",
+        "Content-Type": "application/json",
+        # Playlist pages are verbose JSON that compresses several-fold over the wire.
+        "Accept-Encoding": "gzip",
+    }
 
 
 def fetch_access_token(client_id: str, client_secret: str, refresh_token: str) -> str:
     """Swap the long-lived refresh token for a short-lived bearer token for API calls."""
+    # Reuse a still-valid token from a previous run to skip the token round-trip entirely.
+    cached_token = load_cached_access_token(refresh_token)
+    if cached_token:
+        logging.info("Reusing cached access token")
+        return cached_token
+
     # Use refresh token flow so this can run unattended on a schedule.
     data = parse.urlencode(
         {
@@ -74,20 +317,23 @@ def fetch_access_token(client_id: str, client_secret: str, refresh_token: str) -
         }
     ).encode()
 
-    credentials = base64.b64encode(f"{client_id}:{client_secret}".encode()).decode()
-    req = request.Request("https://accounts.spotify.com/api/token", data=data, method="POST")
-    req.add_header("Authorization", f"Basic {credentials}")
-    req.add_header("Content-Type", "application/x-www-form-urlencoded")
+    headers = {
+        "Authorization": _basic_auth_header(client_id, client_secret),
+        "Content-Type": "application/x-www-form-urlencoded",
+    }
 
     try:
-        with request.urlopen(req) as resp:
-            payload = json.load(resp)
-        return payload["access_token"]
-    except error.HTTPError as exc:
-        detail = exc.read().decode()
-        raise RuntimeError(f"Failed to refresh token: {exc.status} {detail}") from exc
-    except error.URLError as exc:
-        raise RuntimeError(f"Network error while refreshing token: {exc.reason}") from exc
+        status, _, raw_body = http_request(
+            "POST", "https://accounts.spotify.com/api/token", body=data, headers=headers
+        )
+    except (OSError, http.client.HTTPException) as exc:
+        raise RuntimeError(f"Network error while refreshing token: {exc}") from exc
+    if status >= 400:
+        raise RuntimeError(f"Failed to refresh token: {status} {raw_body.decode()}")
+    payload = json.loads(raw_body)
+    access_token = payload["access_token"]
+    save_cached_access_token(refresh_token, access_token, int(payload.get("expires_in", 3600)))
+    return access_token
 
 
 def spotify_request(
@@ -98,33 +344,62 @@ def spotify_request(
     data: Optional[Any] = None,
 ) -> Dict[str, Any]:
     """Perform a Spotify Web API request with consistent headers, encoding, and errors."""
-    # Minimal helper around urllib with uniform error handling and JSON bodies.
+    # Minimal helper around a keep-alive connection with uniform error handling and JSON bodies.
     if params:
         url = f"{url}?{parse.urlencode(params)}"
 
     payload = None
     if data is not None:
-        payload = json.dumps(data).encode()
-
-    req = request.Request(url, data=payload, method=method.upper())
-    req.add_header("Authorization", f"Bearer {access_token}")
-    req.add_header("Content-Type", "application/json")
-
+        payload = _json_dumps(data)
+
+    method = method.upper()
+    headers = _api_headers(access_token)
+    for attempt in range(MAX_REQUEST_RETRIES + 1):
+        try:
+            status, resp_headers, raw_body = http_request(
+                method, url, body=payload, headers=headers
+            )
+        except (OSError, http.client.HTTPException) as exc:
+            raise RuntimeError(f"Network error calling Spotify: {exc}") from exc
+        if attempt == MAX_REQUEST_RETRIES or not is_retryable(method, status):
+            break
+        # Concurrent calls can trip the rate limit; back off instead of failing the whole run.
+        delay = retry_delay_seconds(resp_headers, attempt)
+        logging.warning("Spotify returned %d for %s; retrying in %.1fs", status, method, delay)
+        time.sleep(delay)
+
+    if status >= 400:
+        raise RuntimeError(f"Spotify API error {status}: {raw_body.decode()}")
+    if status == 204 or not raw_body:
+        return {}
     try:
-        with request.urlopen(req) as resp:
-            if resp.status == 204:
-                return {}
-            raw_body = resp.read()
-            if not raw_body:
-                return {}
-            return json.loads(raw_body)
+        return _json_loads(raw_body)
     except json.JSONDecodeError as exc:
         raise RuntimeError("Spotify API returned non-JSON body") from exc
-    except error.HTTPError as exc:
-        detail = exc.read().decode()
-        raise RuntimeError(f"Spotify API error {exc.status}: {detail}") from exc
-    except error.URLError as exc:
-        raise RuntimeError(f"Network error calling Spotify: {exc.reason}") from exc
+
+
+def is_retryable(method: str, status: int) -> bool:
+    """Return whether a response status is transient and the request safe to send again."""
+    # A 429 means Spotify rejected the request unprocessed, so any method may be retried.
+    if status == 429:
+        return True
+    return status in RETRYABLE_SERVER_ERRORS and method in IDEMPOTENT_METHODS
+
+
+def retry_delay_seconds(headers: http.client.HTTPMessage, attempt: int) -> float:
+    """Return how long to wait before retry `attempt`, honoring Retry-After when present."""
+    # Fall back to capped exponential backoff; jitter keeps parallel workers from retrying
+    # in lockstep and tripping the limit again together.
+    try:
+        delay = float(headers["Retry-After"])
+    except (KeyError, TypeError, ValueError):
+        delay = min(2**attempt, MAX_BACKOFF_SECONDS)
+    if delay > MAX_RETRY_AFTER_SECONDS:
+        raise RuntimeError(
+            f"Spotify asked to retry after {delay:.0f}s (limit {MAX_RETRY_AFTER_SECONDS}s); "
+            "giving up instead of waiting. Try again later."
+        )
+    return max(delay, 0.0) + random.uniform(0, 0.5)
 
 
 def update_playlist_description(access_token: str, playlist_id: str, description: str) -> None:
@@ -144,54 +419,87 @@ def get_current_user(access_token: str) -> Dict[str, Any]:
     return spotify_request("GET", "https://api.spotify.com/v1/me", access_token)
 
 
+def paginate(
+    access_token: str, url: str, limit: int, params: Optional[Dict[str, Any]] = None
+) -> Iterable[Dict[str, Any]]:
+    """Yield every item of a Spotify paging endpoint in order, fetching later pages in parallel."""
+    # The first page reports `total`, so all remaining offsets are known up front and can be
+    # requested concurrently; results are still yielded in offset order.
+    def fetch_page(offset: int) -> Dict[str, Any]:
+        page_params = {**(params or {}), "limit": limit, "offset": offset}
+        return spotify_request("GET", url, access_token, params=page_params)
+
+    first_page = fetch_page(0)
+    yield from first_page.get("items", [])
+
+    remaining_offsets = range(limit, first_page.get("total", 0), limit)
+    if not remaining_offsets:
+        # Everything fit in the first page; don't spin up worker threads for nothing.
+        return
+
+    workers = min(PAGE_FETCH_WORKERS, len(remaining_offsets))
+    offsets = iter(remaining_offsets)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # Only keep a worker-sized window of pages in flight so a huge playlist streams through
+        # the caller instead of piling up in memory as finished pages.
+        pending = deque(
+            executor.submit(fetch_page, offset) for offset in itertools.islice(offsets, workers)
+        )
+        try:
+            while pending:
+                page = pending.popleft().result()
+                next_offset = next(offsets, None)
+                if next_offset is not None:
+                    pending.append(executor.submit(fetch_page, next_offset))
+                yield from page.get("items", [])
+        finally:
+            # Don't fetch pages nobody will read if the caller stops early or a page fails.
+            for future in pending:
+                future.cancel()
+
+
 def paginate_playlists(access_token: str) -> Iterable[Dict[str, Any]]:
     """Yield all playlists accessible to the user, paging through Spotify results."""
     # Iterate through all playlists without manual paging logic elsewhere.
-    url = "https://api.spotify.com/v1/me/playlists"
-    params = {"limit": 50, "offset": 0}
-    while True:
-        page = spotify_request("GET", url, access_token, params=params)
-        for item in page.get("items", []):
-            yield item
-        if not page.get("next"):
-            break
-        params["offset"] += params["limit"]
+    return paginate(access_token, "https://api.spotify.com/v1/me/playlists", limit=50)
 
 
-def find_playlist_by_name_owner(
-    access_token: str, owner_id: str, target_name: str
-) -> Optional[Dict[str, Any]]:
-    """Locate a playlist by exact name that is owned by the given user ID."""
-    # Ensure we act only on playlists owned by the authenticated user.
-    for playlist in paginate_playlists(access_token):
-        if (
-            playlist.get("name") == target_name
-            and playlist.get("owner", {}).get("id") == owner_id
-        ):
-            return playlist
-    return None
+def index_owned_playlists(
+    playlists: Iterable[Dict[str, Any]], owner_id: str
+) -> Dict[str, Dict[str, Any]]:
+    """Index the playlists owned by owner_id by name for in-memory lookups."""
+    # Ensure we act only on playlists owned by the authenticated user. One snapshot serves
+    # every lookup in a run instead of re-paging all playlists per lookup.
+    playlists_by_name: Dict[str, Dict[str, Any]] = {}
+    for playlist in playlists:
+        if playlist.get("owner", {}).get("id") == owner_id:
+            # Keep the first match so duplicate names resolve the same way a linear scan would.
+            playlists_by_name.setdefault(playlist.get("name"), playlist)
+    return playlists_by_name
 
 
 def paginate_playlist_items(access_token: str, playlist_id: str) -> Iterable[Dict[str, Any]]:
     """Yield every track item from the specified playlist, handling pagination."""
-    # Stream all tracks from a playlist, respecting API paging.
-    url = f"https://api.spotify.com/v1/playlists/{playlist_id}/tracks"
-    params = {"limit": 100, "offset": 0}
-    while True:
-        page = spotify_request("GET", url, access_token, params=params)
-        for item in page.get("items", []):
-            yield item
-        if not page.get("next"):
-            break
-        params["offset"] += params["limit"]
+    # Stream all tracks from a playlist, respecting API paging. Only `total`, `added_at` and
+    # the track URI are used, so have Spotify drop the rest of each (large) track object.
+    return paginate(
+        access_token,
+        f"https://api.spotify.com/v1/playlists/{playlist_id}/tracks",
+        limit=100,
+        params={"fields": "total,items(added_at,track(uri))"},
+    )
 
 
 def ensure_junk_drawer_playlist(
-    access_token: str, user_id: str, name: str, description: str
+    access_token: str,
+    user_id: str,
+    name: str,
+    description: str,
+    playlists_by_name: Dict[str, Dict[str, Any]],
 ) -> str:
     """Return ID of the named Junk Drawer playlist, creating it if absent."""
     # Create the destination playlist on-demand to keep runs idempotent.
-    existing = find_playlist_by_name_owner(access_token, user_id, name)
+    existing = playlists_by_name.get(name)
     if existing:
         return existing["id"]
 
@@ -204,13 +512,15 @@ def ensure_junk_drawer_playlist(
         "POST", f"https://api.spotify.com/v1/users/{user_id}/playlists", access_token, data=body
     )
     logging.info("Created playlist %s (%s)", name, created.get("id"))
+    # Record the new playlist in the snapshot so later lookups find it without a refetch.
+    playlists_by_name[name] = created
     return created["id"]
 
 
-def add_tracks_to_playlist(access_token: str, playlist_id: str, uris: List[str]) -> None:
+def add_tracks_to_playlist(access_token: str, playlist_id: str, uris: Sequence[str]) -> None:
     """Add the given track URIs to a playlist in Spotify-compliant batches of 100."""
     # Add tracks in batches to respect API limits.
-    for chunk in chunked(uris, 100):
+    for chunk in chunked(uris, TRACK_BATCH_SIZE):
         spotify_request(
             "POST",
             f"https://api.spotify.com/v1/playlists/{playlist_id}/tracks",
@@ -220,43 +530,68 @@ def add_tracks_to_playlist(access_token: str, playlist_id: str, uris: List[str])
         logging.info("Added %d tracks to %s", len(chunk), playlist_id)
 
 
-def remove_tracks_from_playlist(access_token: str, playlist_id: str, uris: List[str]) -> None:
+def remove_tracks_from_playlist(
+    access_token: str, playlist_id: str, uris: Sequence[str], snapshot_id: Optional[str] = None
+) -> None:
     """Remove the given track URIs from a playlist in batches to honor API limits."""
-    # Remove tracks in batches to respect API limits.
-    for chunk in chunked(uris, 100):
+    # Remove tracks in batches to respect API limits; pin to the snapshot we read when given.
+    for chunk in chunked(uris, TRACK_BATCH_SIZE):
+        body: Dict[str, Any] = {"tracks": [{"uri": uri} for uri in chunk]}
+        if snapshot_id:
+            body["snapshot_id"] = snapshot_id
         spotify_request(
             "DELETE",
             f"https://api.spotify.com/v1/playlists/{playlist_id}/tracks",
             access_token,
-            data={"tracks": [{"uri": uri} for uri in chunk]},
+            data=body,
         )
         logging.info("Removed %d tracks from %s", len(chunk), playlist_id)
 
 
-def chunked(seq: List[str], size: int) -> Iterable[List[str]]:
-    """Yield sequential slices from a list with the requested maximum length."""
-    for i in range(0, len(seq), size):
-        yield seq[i : i + size]
-
-
-def iso_to_date(iso_ts: str) -> dt.date:
-    """Convert an ISO 8601 timestamp (with trailing Z) to a naive date for comparisons."""
-    # Normalize Spotify's timestamp into a date for age comparisons.
-    # Spotify returns ISO timestamps like "2025-11-29T12:34:56Z"
-    clean = iso_ts.rstrip("Z")
-    return dt.datetime.fromisoformat(clean).date()
+def move_tracks(
+    access_token: str,
+    source_id: str,
+    target_id: str,
+    uris: Sequence[str],
+    snapshot_id: Optional[str] = None,
+) -> None:
+    """Move track URIs from the source to the target playlist, batch by batch."""
+    # Pair each add with its remove so they go out back-to-back on the same connection and a
+    # mid-run failure leaves at most one batch present in both playlists.
+    for chunk in chunked(uris, TRACK_BATCH_SIZE):
+        add_tracks_to_playlist(access_token, target_id, chunk)
+        remove_tracks_from_playlist(access_token, source_id, chunk, snapshot_id)
+
+
+def move_bucket(
+    access_token: str,
+    user_id: str,
+    playlists_by_name: Dict[str, Dict[str, Any]],
+    source_id: str,
+    snapshot_id: Optional[str],
+    name: str,
+    base_description: str,
+    uris: Sequence[str],
+    run_timestamp: str,
+) -> int:
+    """Find or create one bucket's Junk Drawer, move its tracks in, and stamp its description."""
+    # Run each bucket as one chain so a slow create for one year never holds up the others.
+    target_id = ensure_junk_drawer_playlist(
+        access_token, user_id, name, base_description, playlists_by_name
+    )
+    move_tracks(access_token, source_id, target_id, uris, snapshot_id)
+    description = f"{base_description}. Last run {run_timestamp} moved {len(uris)} tracks."
+    update_playlist_description(access_token, target_id, description)
+    return len(uris)
 
 
-def group_tracks_by_year_suffix(
-    tracks: List[Tuple[str, dt.date]]
-) -> Dict[str, List[Tuple[str, dt.date]]]:
-    """Group (uri, added_date) pairs by two-digit year suffix for playlist routing."""
-    # Bucket tracks by year suffix to route them into the correct Junk Drawer.
-    buckets: Dict[str, List[Tuple[str, dt.date]]] = {}
-    for uri, added_date in tracks:
-        year_suffix = f"{added_date.year % 100:02d}"
-        buckets.setdefault(year_suffix, []).append((uri, added_date))
-    return buckets
+def chunked(seq: Sequence[str], size: int) -> Iterable[Sequence[str]]:
+    """Yield sequential batches from a sequence with the requested maximum length."""
+    # itertools.batched (Python 3.12+) builds batches in C without index bookkeeping; older
+    # Pythons fall back to slices, which are a single C-level copy per batch.
+    if hasattr(itertools, "batched"):
+        return itertools.batched(seq, size)
+    return (seq[i : i + size] for i in range(0, len(seq), size))
 
 
 def main() -> None:
@@ -292,63 +627,77 @@ def main() -> None:
 
     # Authenticate as the current user using the refresh token.
     access_token = fetch_access_token(client_id, client_secret, refresh_token)
-    me = get_current_user(access_token)
+    # The profile and the playlist listing don't depend on each other, so page through the
+    # playlists in the background while /me is in flight.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        playlists_future = executor.submit(list, paginate_playlists(access_token))
+        me = get_current_user(access_token)
+        playlists = playlists_future.result()
     user_id = me.get("id")
     logging.info("Authenticated as %s", me.get("display_name") or user_id)
 
     # Locate the source playlist owned by this user; abort if not found.
-    source_playlist = find_playlist_by_name_owner(access_token, user_id, source_playlist_name)
+    playlists_by_name = index_owned_playlists(playlists, user_id)
+    source_playlist = playlists_by_name.get(source_playlist_name)
     if not source_playlist:
         raise RuntimeError(f"Could not find playlist '{source_playlist_name}' owned by this user.")
     source_playlist_id = source_playlist["id"]
+    source_snapshot_id = source_playlist.get("snapshot_id")
     logging.info("Using source playlist '%s' (%s)", source_playlist_name, source_playlist_id)
 
     # Determine the cutoff date; only tracks added on/before this are eligible.
     cutoff_date = dt.date.today() - dt.timedelta(days=duration_days)
-    # Collect candidate tracks with their added dates for later bucketing.
-    candidates: List[Tuple[str, dt.date]] = []
+    # Spotify returns fixed-width ISO timestamps like "2025-11-29T12:34:56Z", so comparing the
+    # date prefix as a string orders the same as parsing it, without a datetime per track.
+    cutoff_iso = cutoff_date.isoformat()
+    # Bucket eligible track URIs by two-digit year suffix as pages stream in, so each batch
+    # goes to the right Junk Drawer without holding an intermediate candidates list.
+    buckets: Dict[str, List[str]] = defaultdict(list)
     for item in paginate_playlist_items(access_token, source_playlist_id):
         added_at = item.get("added_at")
         track = item.get("track") or {}
         uri = track.get("uri")
         if not (added_at and uri):
             continue
-        added_date = iso_to_date(added_at)
-        if added_date <= cutoff_date:
-            candidates.append((uri, added_date))
+        if added_at[:10] <= cutoff_iso:
+            buckets[added_at[2:4]].append(uri)
 
-    logging.info(
-        "Found %d tracks added on or before %s to move", len(candidates), cutoff_date.isoformat()
-    )
-    if not candidates:
+    candidate_count = sum(len(uris) for uris in buckets.values())
+    logging.info("Found %d tracks added on or before %s to move", candidate_count, cutoff_iso)
+    if not candidate_count:
         return
 
     run_timestamp = dt.datetime.now(dt.timezone.utc).isoformat(timespec="seconds")
     total_moved = 0
-    # Group tracks by year suffix so each batch goes to the right Junk Drawer.
-    buckets = group_tracks_by_year_suffix(candidates)
-    for year_suffix, tracks in buckets.items():
-        playlist_name = f"{year_suffix} Junk Drawer"
-        base_description = f"Junk drawer of tracks added in {year_suffix} from {source_playlist_name}"
-        # Create/find the destination playlist for this year bucket.
-        target_playlist_id = ensure_junk_drawer_playlist(
-            access_token, user_id, playlist_name, base_description
-        )
+    playlist_names = {year_suffix: f"{year_suffix} Junk Drawer" for year_suffix in buckets}
+    # Buckets touch different destination playlists, so each runs as its own find/create ->
+    # move -> describe chain side by side; spotify_request backs off if this trips the limit.
+    with ThreadPoolExecutor(max_workers=BUCKET_WORKERS) as executor:
+        move_futures = {
+            executor.submit(
+                move_bucket,
+                access_token,
+                user_id,
+                playlists_by_name,
+                source_playlist_id,
+                source_snapshot_id,
+                playlist_names[year_suffix],
+                f"Junk drawer of tracks added in {year_suffix} from {source_playlist_name}",
+                uris,
+                run_timestamp,
+            ): year_suffix
+            for year_suffix, uris in buckets.items()
+        }
 
-        uris = [uri for uri, _ in tracks]
-        # Move the tracks: add to the destination, then remove from the source.
-        add_tracks_to_playlist(access_token, target_playlist_id, uris)
-        remove_tracks_from_playlist(access_token, source_playlist_id, uris)
-        total_moved += len(uris)
-
-        description = f"{base_description}. Last run {run_timestamp} moved {len(uris)} tracks."
-        update_playlist_description(access_token, target_playlist_id, description)
-        logging.info(
-            "Moved %d tracks to '%s' from '%s'",
-            len(uris),
-            playlist_name,
-            source_playlist_name,
-        )
+        for future in as_completed(move_futures):
+            moved = future.result()
+            total_moved += moved
+            logging.info(
+                "Moved %d tracks to '%s' from '%s'",
+                moved,
+                playlist_names[move_futures[future]],
+                source_playlist_name,
+            )
 
     source_description = (
         f"{source_playlist_name} (managed by Junk Mover). "
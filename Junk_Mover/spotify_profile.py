@@ -1,25 +1,10 @@
 import base64
 import json
 import os
-from pathlib import Path
 from typing import Any, Dict, List
 from urllib import error, parse, request
 
-ROOT = Path(__file__).resolve().parents[1]
-
-
-def load_env_from_root() -> None:
-    # Keep configuration in one place by reading the repo-level .env at runtime.
-    """Load .env values from the project root into os.environ if present."""
-    env_path = ROOT / ".env"
-    if not env_path.exists():
-        return
-
-    for line in env_path.read_text().splitlines():
-        if not line or line.lstrip().startswith('#') or '=' not in line:
-            continue
-        key, value = line.split('=', 1)
-        os.environ.setdefault(key.strip(), value.strip())
+from _env import load_env_from_root
 
 
 def require_env(keys: List[str]) -> None: